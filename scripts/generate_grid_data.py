@@ -1,60 +1,150 @@
+import argparse
+import io
 import json
+import os
 import re
 import zipfile
-from datetime import UTC, datetime, time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass, fields, is_dataclass
+from datetime import UTC, date, datetime, time
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from xml.etree import ElementTree as ET
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from xml.parsers import expat
 
 import openpyxl
 from openpyxl.utils.cell import get_column_letter
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib encoder writes the same JSON
+    orjson = None  # type: ignore[assignment]
+
+try:
+    from lxml import etree as ET
+except ImportError:  # lxml is optional; the stdlib parser reads the same XML
+    from xml.etree import ElementTree as ET  # type: ignore[no-redef]
+
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # python-calamine is an optional, much faster reader (--calamine)
+    CalamineWorkbook = None  # type: ignore[assignment,misc]
+
 ROOT = Path(__file__).resolve().parents[1]
 GRID_PATH = ROOT / "2025 Grid.xlsm"
 OUTPUT_PATH = ROOT / "docs" / "assets" / "grid-data.json"
+PRETTY_OUTPUT_PATH = OUTPUT_PATH.with_suffix(".pretty.json")
 
 
 def serialise_datetime(value: Any) -> Optional[str]:
+    # Cheapest and most common cases first: empty cells and plain text.
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return value
     if isinstance(value, datetime):
         return value.isoformat()
     if isinstance(value, time):
         return value.strftime("%H:%M")
-    if value is None:
-        return None
     return str(value)
 
 
 SCHEDULE_START_COLUMN = 8
 SCHEDULE_GROUP_WIDTH = 3
-SCHEDULE_HEADER_TOKENS = {
-    "rk",
-    "team",
-    "teams",
-    "time",
-    "circa",
-}
+SCHEDULE_HEADER_TOKENS = frozenset(
+    {
+        "rk",
+        "team",
+        "teams",
+        "time",
+        "circa",
+    }
+)
+
+# Any one of these marks a cell as the date/time column of a schedule group.
+_RE_SCHEDULE_TOKEN = re.compile(
+    r"\b\d{1,2}(?::\d{2})?\s*(?:am|pm)\b"
+    r"|\A\s*\d{1,2}:\d{2}\s*\Z"
+    r"|\b(?:mon|tue|wed|thu|fri|sat|sun)\b"
+    r"|\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\b"
+    r"|\d{4}-\d{2}-\d{2}"
+    r"|\d{1,2}/\d{1,2}"
+)
 
 
 MAIN_NAMESPACE = {"main": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+# expat reports namespaced names as "<uri> <local>" with namespace_separator=" ".
+CELL_ELEMENT = f"{MAIN_NAMESPACE['main']} c"
+
+
+# Parsed records are slotted dataclasses rather than dicts; orjson serialises
+# them natively, in field order (_json_default does the same for json).
+@dataclass(slots=True)
+class ScheduleGame:
+    team: Any
+    line: Any
+    date: Optional[str]
+    opponent: Any
+    time: Optional[str]
+    opponent_line: Any
+
+
+# A game whose opponent row never arrived keeps only its first three fields.
+@dataclass(slots=True)
+class UnpairedScheduleGame:
+    team: Any
+    line: Any
+    date: Optional[str]
+
+
+@dataclass(slots=True)
+class Pick:
+    team: Any
+    points: int
+    result: str
+    awarded_points: Optional[int]
+
+
+@dataclass(slots=True)
+class BestBet:
+    time: Optional[str]
+    team: Any
+    line: Any
+
+
+@dataclass(slots=True)
+class PlayerEntry:
+    name: Any
+    picks: List[Pick]
+    total_points: Any
+    best_bet: Optional[BestBet]
 
 
 class WorkbookStyleInspector:
-    def __init__(self, workbook_path: Path) -> None:
-        self.workbook_path = workbook_path
+    def __init__(self, workbook: Union[Path, zipfile.ZipFile]) -> None:
+        # An already-open archive is borrowed and left open on exit, so the
+        # caller can share one decompressed copy of the workbook.
+        self.workbook = workbook
         self.archive: Optional[zipfile.ZipFile] = None
         self.sheet_targets: Dict[str, str] = {}
         self.style_outcome: Dict[int, str] = {}
-        self._style_cache: Dict[str, Dict[str, int]] = {}
+        self._outcome_cache: Dict[str, Dict[str, str]] = {}
 
     def __enter__(self) -> "WorkbookStyleInspector":
-        self.archive = zipfile.ZipFile(self.workbook_path)
+        if isinstance(self.workbook, zipfile.ZipFile):
+            self.archive = self.workbook
+        else:
+            self.archive = zipfile.ZipFile(self.workbook)
         self._load_metadata()
         return self
 
     def __exit__(self, exc_type, exc, traceback) -> None:  # type: ignore[override]
-        if self.archive is not None:
+        if self.archive is not None and self.archive is not self.workbook:
             self.archive.close()
-            self.archive = None
+        self.archive = None
 
     def _load_metadata(self) -> None:
         assert self.archive is not None
@@ -62,23 +152,29 @@ class WorkbookStyleInspector:
         workbook_tree = ET.fromstring(self.archive.read("xl/workbook.xml"))
         rels_tree = ET.fromstring(self.archive.read("xl/_rels/workbook.xml.rels"))
 
-        relationship_map = {
-            rel.attrib["Id"]: rel.attrib["Target"]
-            for rel in rels_tree
-            if "Id" in rel.attrib and "Target" in rel.attrib
-        }
-
         sheets_parent = workbook_tree.find("main:sheets", MAIN_NAMESPACE)
         if sheets_parent is None:
             return
 
+        sheet_rels: Dict[str, str] = {}
         for sheet in sheets_parent.findall("main:sheet", MAIN_NAMESPACE):
             name = sheet.attrib.get("name")
             rel_id = sheet.attrib.get(
                 "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
             )
-            if not name or not rel_id:
-                continue
+            if name and rel_id:
+                sheet_rels[name] = rel_id
+
+        # An .xlsm also relates themes, styles, shared strings and the VBA
+        # project; only targets referenced by a sheet are kept.
+        needed_rels = set(sheet_rels.values())
+        relationship_map = {
+            rel.attrib["Id"]: rel.attrib["Target"]
+            for rel in rels_tree
+            if rel.attrib.get("Id") in needed_rels and "Target" in rel.attrib
+        }
+
+        for name, rel_id in sheet_rels.items():
             target = relationship_map.get(rel_id)
             if target:
                 self.sheet_targets[name] = target
@@ -116,71 +212,121 @@ class WorkbookStyleInspector:
                 outcome = "pending"
             self.style_outcome[idx] = outcome
 
-    def _get_sheet_style_map(self, sheet_name: str) -> Dict[str, int]:
+    def _get_sheet_outcomes(self, sheet_name: str) -> Dict[str, str]:
         assert self.archive is not None
 
         target = self.sheet_targets.get(sheet_name)
         if not target:
             return {}
-        if target in self._style_cache:
-            return self._style_cache[target]
-
-        xml_bytes = self.archive.read(f"xl/{target}")
-        tree = ET.fromstring(xml_bytes)
-        style_map: Dict[str, int] = {}
-        for cell in tree.findall(".//main:c", MAIN_NAMESPACE):
-            ref = cell.attrib.get("r")
-            style = cell.attrib.get("s")
-            if ref and style is not None:
-                try:
-                    style_map[ref] = int(style)
-                except ValueError:
-                    continue
-        self._style_cache[target] = style_map
-        return style_map
+        if target in self._outcome_cache:
+            return self._outcome_cache[target]
+
+        # Only the r/s attributes of <c> start tags matter, so a bare expat
+        # handler skips tree building and all character data. Styles are
+        # resolved to outcomes here; pending cells are left out and fall back
+        # to the default in get_cell_outcome.
+        style_outcome = self.style_outcome
+        outcomes: Dict[str, str] = {}
+
+        def start_element(name: str, attrs: Dict[str, str]) -> None:
+            if name == CELL_ELEMENT:
+                ref = attrs.get("r")
+                style = attrs.get("s")
+                if ref and style is not None:
+                    try:
+                        outcome = style_outcome.get(int(style), "pending")
+                    except ValueError:
+                        return
+                    if outcome != "pending":
+                        outcomes[ref] = outcome
+
+        parser = expat.ParserCreate(namespace_separator=" ")
+        parser.StartElementHandler = start_element
+        with self.archive.open(f"xl/{target}") as handle:
+            parser.ParseFile(handle)
+        self._outcome_cache[target] = outcomes
+        return outcomes
 
     def get_cell_outcome(self, sheet_name: str, cell_ref: str) -> str:
-        style_map = self._get_sheet_style_map(sheet_name)
-        style_idx = style_map.get(cell_ref)
-        if style_idx is None:
-            return "pending"
-        return self.style_outcome.get(style_idx, "pending")
+        return self._get_sheet_outcomes(sheet_name).get(cell_ref, "pending")
+
+
+# Whole floats beyond this are written in exponent form by Excel, which
+# openpyxl keeps as floats; they may not fit orjson's 64-bit integers either.
+_CALAMINE_MAX_INT = 2**53
+
+
+def _from_calamine(value: Any) -> Any:
+    # Map values onto what openpyxl produces: blanks are None, whole numbers
+    # are ints and date-only cells are midnight datetimes. Error cells
+    # (#N/A, #DIV/0!) also come back from calamine as "" and so read as
+    # blanks where openpyxl gives the error string, which is why this reader
+    # is opt-in.
+    if value == "":
+        return None
+    value_type = type(value)
+    if value_type is float:
+        return int(value) if value.is_integer() and abs(value) < _CALAMINE_MAX_INT else value
+    if value_type is date:
+        return datetime(value.year, value.month, value.day)
+    return value
+
+
+class CalamineWorksheet:
+    """Read-only view of a python-calamine sheet with openpyxl's row interface."""
 
+    def __init__(self, workbook: Any, title: str) -> None:
+        self._workbook = workbook
+        self.title = title
 
+    def iter_rows(self, values_only: bool = True) -> Iterator[tuple]:
+        # The sheet is only loaded once rows are requested. calamine's
+        # iter_rows() drops leading empty columns, so the rows are taken with
+        # skip_empty_area=False instead: they are anchored at A1 and positions
+        # line up with openpyxl and the cell references the style inspector
+        # uses.
+        sheet = self._workbook.get_sheet_by_name(self.title)
+        for row in sheet.to_python(skip_empty_area=False):
+            yield tuple(map(_from_calamine, row))
+
+
+# Both readers hand back exact built-in types, so the schedule helpers below
+# dispatch on type() instead of walking isinstance() checks.
 def normalise_schedule_line(value: Any) -> Any:
-    if isinstance(value, (int, float)):
+    value_type = type(value)
+    if value_type is float or value_type is int or value_type is bool:
         return float(value)
     return value
 
 
+@lru_cache(maxsize=4096)
+def _is_header_label(value: str) -> bool:
+    # Header labels repeat on every sheet, so cache the verdict per string.
+    return value.strip().lower() in SCHEDULE_HEADER_TOKENS
+
+
+def _is_header_token(value: Any) -> bool:
+    return type(value) is str and _is_header_label(value)
+
+
+# Every week sheet shares one template, so the same cell triples (blank
+# groups, header labels, kickoff times) recur across sheets. typed=True keeps
+# equal-but-different values such as 1, 1.0 and True apart.
+@lru_cache(maxsize=4096, typed=True)
 def _looks_like_schedule_start(date_or_time: Any, team: Any, line: Any) -> bool:
-    if isinstance(team, str) and team.strip().lower() in SCHEDULE_HEADER_TOKENS:
+    if _is_header_token(team) or _is_header_token(line):
         return False
 
-    if isinstance(line, str) and line.strip().lower() in SCHEDULE_HEADER_TOKENS:
-        return False
+    value_type = type(date_or_time)
+    if value_type is datetime or value_type is time:
+        return True
 
-    if isinstance(date_or_time, (datetime, time)):
+    # The pattern tolerates surrounding whitespace itself, so the cell is not
+    # stripped first; blank strings simply fail to match.
+    if value_type is str and _RE_SCHEDULE_TOKEN.search(date_or_time.lower()):
         return True
 
-    if isinstance(date_or_time, str):
-        stripped = date_or_time.strip()
-        if stripped:
-            lowered = stripped.lower()
-            if re.search(r"\b\d{1,2}(:\d{2})?\s*(am|pm)\b", lowered):
-                return True
-            if re.fullmatch(r"\d{1,2}:\d{2}", stripped):
-                return True
-            if re.search(r"\b(?:mon|tue|wed|thu|fri|sat|sun)\b", lowered):
-                return True
-            if re.search(r"\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\b", lowered):
-                return True
-            if re.search(r"\d{4}-\d{2}-\d{2}", stripped):
-                return True
-            if re.search(r"\d{1,2}/\d{1,2}", stripped):
-                return True
-
-    if isinstance(team, str) and team.strip() and line not in (None, ""):
+    if type(team) is str and team.strip() and line not in (None, ""):
         return True
 
     return False
@@ -190,30 +336,34 @@ def _should_ignore_schedule_cells(date_or_time: Any, team: Any, line: Any) -> bo
     if date_or_time is None and team is None and line is None:
         return True
 
-    if isinstance(team, str) and team.strip().lower() in SCHEDULE_HEADER_TOKENS:
-        return True
+    if date_or_time is not None:
+        # _looks_like_schedule_start already rejects header labels.
+        return not _looks_like_schedule_start(date_or_time, team, line)
 
-    if isinstance(line, str) and line.strip().lower() in SCHEDULE_HEADER_TOKENS:
-        return True
+    return _is_header_token(team) or _is_header_token(line)
 
-    if date_or_time is not None and not _looks_like_schedule_start(date_or_time, team, line):
-        return True
 
-    return False
+def parse_schedule_rows(
+    rows: List[tuple], header_index: int
+) -> List[Union[ScheduleGame, UnpairedScheduleGame]]:
+    schedule: List[Union[ScheduleGame, UnpairedScheduleGame]] = []
+    # The rows above the header are read through islice rather than copied
+    # out with a slice. Skip the column search when they are all blank.
+    if all(row.count(None) == len(row) for row in islice(rows, header_index)):
+        return []
 
+    # Pad every row to one width so each schedule group can be indexed directly.
+    width = (
+        max(max(map(len, islice(rows, header_index)), default=0), SCHEDULE_START_COLUMN)
+        + SCHEDULE_GROUP_WIDTH
+    )
+    padded_rows = [row + (None,) * (width - len(row)) for row in islice(rows, header_index)]
 
-def parse_schedule_rows(rows: List[tuple], header_index: int) -> List[Dict[str, Any]]:
-    schedule: List[Dict[str, Any]] = []
     column_starts: List[int] = []
-    for row in rows[:header_index]:
+    for row, padded in zip(rows, padded_rows):
         row_starts: List[int] = []
-        row_length = len(row)
-        for col in range(row_length):
-            cells = [
-                row[col + offset] if col + offset < row_length else None
-                for offset in range(SCHEDULE_GROUP_WIDTH)
-            ]
-            if _looks_like_schedule_start(*cells):
+        for col in range(len(row)):
+            if _looks_like_schedule_start(padded[col], padded[col + 1], padded[col + 2]):
                 row_starts.append(col)
         if row_starts:
             column_starts = row_starts
@@ -223,54 +373,59 @@ def parse_schedule_rows(rows: List[tuple], header_index: int) -> List[Dict[str,
         column_starts = [SCHEDULE_START_COLUMN]
 
     # ensure deterministic ordering and no duplicates
-    column_starts = sorted(dict.fromkeys(column_starts))
+    column_starts = sorted(set(column_starts))
 
-    current_rows: Dict[int, Dict[str, Any]] = {start: {} for start in column_starts}
+    # First half of each column group's game, as (team, line, date), until
+    # the opponent row arrives.
+    pending: Dict[int, Optional[Tuple[Any, Any, Any]]] = dict.fromkeys(column_starts)
 
-    for row in rows[:header_index]:
+    for row in padded_rows:
         for start in column_starts:
-            cells = [
-                row[start + offset] if start + offset < len(row) else None
-                for offset in range(SCHEDULE_GROUP_WIDTH)
-            ]
-            if not any(cell is not None for cell in cells):
+            date_or_time, team, line = row[start], row[start + 1], row[start + 2]
+            if date_or_time is None and team is None and line is None:
                 continue
 
-            date_or_time, team, line = cells
-            entry = current_rows[start]
+            first_half = pending[start]
 
-            if not entry:
+            if first_half is None:
                 if _should_ignore_schedule_cells(date_or_time, team, line):
                     continue
 
-                current_rows[start] = {
-                    "team": serialise_datetime(team) if team is not None else "",
-                    "line": normalise_schedule_line(line),
-                    "date": serialise_datetime(date_or_time),
-                }
+                pending[start] = (
+                    serialise_datetime(team) if team is not None else "",
+                    normalise_schedule_line(line),
+                    serialise_datetime(date_or_time),
+                )
             else:
-                entry.update(
-                    {
-                        "opponent": serialise_datetime(team) if team is not None else "",
-                        "time": serialise_datetime(date_or_time),
-                        "opponent_line": normalise_schedule_line(line),
-                    }
+                game_team, game_line, game_date = first_half
+                schedule.append(
+                    ScheduleGame(
+                        team=game_team,
+                        line=game_line,
+                        date=game_date,
+                        opponent=serialise_datetime(team) if team is not None else "",
+                        time=serialise_datetime(date_or_time),
+                        opponent_line=normalise_schedule_line(line),
+                    )
                 )
-                schedule.append(entry.copy())
-                current_rows[start] = {}
+                pending[start] = None
 
-    for entry in current_rows.values():
-        if entry:
-            schedule.append(entry.copy())
+    for first_half in pending.values():
+        if first_half is not None:
+            game_team, game_line, game_date = first_half
+            schedule.append(UnpairedScheduleGame(team=game_team, line=game_line, date=game_date))
 
-    filtered: List[Dict[str, Any]] = []
+    filtered: List[Union[ScheduleGame, UnpairedScheduleGame]] = []
     for item in schedule:
-        team = item.get("team")
-        opponent = item.get("opponent")
-        line = item.get("line")
-        opponent_line = item.get("opponent_line")
+        team = item.team
+        line = item.line
+        if isinstance(item, ScheduleGame):
+            opponent = item.opponent
+            opponent_line = item.opponent_line
+        else:
+            opponent = opponent_line = None
 
-        has_team = isinstance(team, str) and team.strip() and team.strip().lower() not in SCHEDULE_HEADER_TOKENS
+        has_team = isinstance(team, str) and team.strip() and not _is_header_label(team)
         has_opponent = isinstance(opponent, str) and opponent.strip()
         has_line = line not in (None, "") or opponent_line not in (None, "")
 
@@ -280,31 +435,70 @@ def parse_schedule_rows(rows: List[tuple], header_index: int) -> List[Dict[str,
     return filtered
 
 
+def _count_numeric_cells(row: tuple) -> int:
+    # Counting stops at two, which is all either header rule needs.
+    numeric_cells = 0
+    for cell in row:
+        if isinstance(cell, (int, float)):
+            numeric_cells += 1
+            if numeric_cells == 2:
+                break
+    return numeric_cells
+
+
+def _is_preferred_header(row: tuple, numeric_cells: int) -> bool:
+    return numeric_cells == 2 and row[0] is None
+
+
+def _is_header_row(row: tuple) -> bool:
+    # Check the first cell before counting; most rows fail there.
+    if not row or row[0] is not None:
+        return False
+    return _is_preferred_header(row, _count_numeric_cells(row))
+
+
 def detect_header_row(rows: List[tuple]) -> Optional[int]:
+    # Prefer a row with an empty first cell and two numeric cells; otherwise
+    # fall back to the first row holding any number. One pass finds both.
+    fallback: Optional[int] = None
     for idx, row in enumerate(rows):
-        if row and row[0] is None and sum(isinstance(cell, (int, float)) for cell in row) >= 2:
-            return idx
-    for idx, row in enumerate(rows):
-        if any(isinstance(cell, (int, float)) for cell in row):
-            return idx
-    return None
+        numeric_cells = _count_numeric_cells(row)
+        if numeric_cells:
+            if fallback is None:
+                fallback = idx
+            if _is_preferred_header(row, numeric_cells):
+                return idx
+    return fallback
 
 
 def parse_week_sheet(
     sheet, style_inspector: Optional[WorkbookStyleInspector] = None
 ) -> Dict[str, Any]:
-    rows = list(sheet.iter_rows(values_only=True))
-    if not rows:
-        return {"name": sheet.title, "players": [], "schedule": [], "confidence_points": []}
+    # Only the rows up to the header are kept (the schedule lives above it);
+    # player rows are consumed as openpyxl streams them.
+    row_iter = sheet.iter_rows(values_only=True)
+    rows: List[tuple] = []
+    header_index: Optional[int] = None
+    for row in row_iter:
+        rows.append(row)
+        if _is_header_row(row):
+            header_index = len(rows) - 1
+            break
 
-    header_index = detect_header_row(rows)
+    player_rows: Iterable[tuple] = row_iter
     if header_index is None:
-        return {
-            "name": sheet.title,
-            "players": [],
-            "schedule": parse_schedule_rows(rows, 0),
-            "confidence_points": [],
-        }
+        if not rows:
+            return {"name": sheet.title, "players": [], "schedule": [], "confidence_points": []}
+
+        header_index = detect_header_row(rows)
+        if header_index is None:
+            return {
+                "name": sheet.title,
+                "players": [],
+                "schedule": parse_schedule_rows(rows, 0),
+                "confidence_points": [],
+            }
+        player_rows = islice(rows, header_index + 1, None)
 
     header_row = rows[header_index]
 
@@ -328,21 +522,30 @@ def parse_week_sheet(
     best_bet_team_col = best_bet_time_col + 1
     best_bet_line_col = best_bet_team_col + 1
 
-    players: List[Dict[str, Any]] = []
-    for row_offset, row in enumerate(rows[header_index + 1 :]):
+    # Cell references for the style lookup: column letters are fixed per
+    # sheet, and player rows start right below the header (1-based).
+    col_letters = [
+        get_column_letter(start_col + 1 + offset) for offset in range(len(confidence_points))
+    ]
+    base_row = header_index + 2
+
+    players: List[PlayerEntry] = []
+    # (player, score) pairs for the standings, collected while the rows are
+    # already in hand; record_week_scores pops them before output.
+    score_rows: List[Tuple[str, Any]] = []
+    for row_offset, row in enumerate(player_rows):
         player = row[0]
         if not player:
             continue
-        selections = []
+        row_length = len(row)
+        selections: List[Pick] = []
         computed_total = 0
         has_recorded_result = False
-        excel_row = header_index + 2 + row_offset
+        excel_row = base_row + row_offset
         for offset, points in enumerate(confidence_points):
-            col_idx = start_col + offset
-            pick = row[col_idx]
+            pick = row[start_col + offset]
             if pick:
-                column_letter = get_column_letter(col_idx + 1)
-                cell_ref = f"{column_letter}{excel_row}"
+                cell_ref = f"{col_letters[offset]}{excel_row}"
                 outcome = (
                     style_inspector.get_cell_outcome(sheet.title, cell_ref)
                     if style_inspector
@@ -359,40 +562,33 @@ def parse_week_sheet(
                 )
                 if awarded:
                     computed_total += awarded
-                selection: Dict[str, Any] = {
-                    "team": pick,
-                    "points": int(points),
-                    "result": outcome,
-                }
-                if awarded is not None:
-                    selection["awarded_points"] = awarded
-                else:
-                    selection["awarded_points"] = None
-                selections.append(selection)
-        total = row[total_col] if total_col < len(row) else None
+                selections.append(
+                    Pick(team=pick, points=int(points), result=outcome, awarded_points=awarded)
+                )
+        total = row[total_col] if total_col < row_length else None
         if total is None and (has_recorded_result or computed_total):
             total = computed_total
-        best_bet = {
-            "time": row[best_bet_time_col] if best_bet_time_col < len(row) else None,
-            "team": row[best_bet_team_col] if best_bet_team_col < len(row) else None,
-            "line": row[best_bet_line_col] if best_bet_line_col < len(row) else None,
-        }
-        if not any(best_bet.values()):
-            best_bet = None
+        bet_time = row[best_bet_time_col] if best_bet_time_col < row_length else None
+        bet_team = row[best_bet_team_col] if best_bet_team_col < row_length else None
+        bet_line = row[best_bet_line_col] if best_bet_line_col < row_length else None
+        if bet_time or bet_team or bet_line:
+            best_bet: Optional[BestBet] = BestBet(
+                time=serialise_datetime(bet_time),
+                team=bet_team,
+                line=float(bet_line) if isinstance(bet_line, (int, float)) else bet_line,
+            )
         else:
-            best_bet = {
-                "time": serialise_datetime(best_bet.get("time")),
-                "team": best_bet.get("team"),
-                "line": float(best_bet["line"]) if isinstance(best_bet.get("line"), (int, float)) else best_bet.get("line"),
-            }
+            best_bet = None
         players.append(
-            {
-                "name": player,
-                "picks": selections,
-                "total_points": total,
-                "best_bet": best_bet,
-            }
+            PlayerEntry(
+                name=player,
+                picks=selections,
+                total_points=total,
+                best_bet=best_bet,
+            )
         )
+        if isinstance(total, (int, float)) and isinstance(player, str):
+            score_rows.append((player, total))
 
     schedule = parse_schedule_rows(rows, header_index)
 
@@ -401,14 +597,26 @@ def parse_week_sheet(
         "players": players,
         "schedule": schedule,
         "confidence_points": confidence_points,
+        "_score_rows": score_rows,
     }
 
 
+def _column_getter(indices: Tuple[int, ...]) -> Callable[[tuple], tuple]:
+    # itemgetter pulls every requested column out of a row in one C call, but
+    # returns a bare value rather than a tuple when given a single index.
+    if len(indices) > 1:
+        return itemgetter(*indices)
+    if indices:
+        index = indices[0]
+        return lambda row: (row[index],)
+    return lambda row: ()
+
+
 def parse_standings(sheet) -> Dict[str, Dict[str, Any]]:
-    rows = list(sheet.iter_rows(values_only=True))
-    if not rows:
+    row_iter = sheet.iter_rows(values_only=True)
+    header_row = next(row_iter, None)
+    if header_row is None:
         return {}
-    header_row = rows[0]
     try:
         player_col = header_row.index("Player")
     except ValueError as exc:
@@ -419,61 +627,229 @@ def parse_standings(sheet) -> Dict[str, Dict[str, Any]]:
         if isinstance(value, str) and value.startswith("Week"):
             week_columns[value] = idx
 
+    week_names = tuple(week_columns)
+    gather_scores = _column_getter(tuple(week_columns.values()))
+    width = max(week_columns.values(), default=0) + 1
+
     standings: Dict[str, Dict[str, Any]] = {}
-    for row in rows[1:]:
+    for row in row_iter:
         player = row[player_col]
         if not isinstance(player, str):
             continue
-        player_data: Dict[str, Any] = {}
-        for week, col_idx in week_columns.items():
-            score = row[col_idx] if col_idx < len(row) else None
-            if score is not None:
-                player_data[week] = score
-        standings[player] = player_data
+        if len(row) < width:
+            row = row + (None,) * (width - len(row))
+        standings[player] = {
+            week: score
+            for week, score in zip(week_names, gather_scores(row))
+            if score is not None
+        }
     return standings
 
 
-def main() -> None:
-    with WorkbookStyleInspector(GRID_PATH) as style_inspector:
-        workbook = openpyxl.load_workbook(GRID_PATH, data_only=True, read_only=True)
+def record_week_scores(week: Dict[str, Any], standings: Dict[str, Dict[str, Any]]) -> None:
+    # Always pop the side channel so it never reaches the JSON output.
+    score_rows = week.pop("_score_rows", ())
+    week_name = week.get("name")
+    if not isinstance(week_name, str):
+        return
+    for player_name, score in score_rows:
+        standings.setdefault(player_name, {})[week_name] = score
+
+
+def _newline(pretty: bool, depth: int) -> bytes:
+    return b"\n" + b"  " * depth if pretty else b""
 
-        week_sheets = [
-            workbook[sheet]
-            for sheet in workbook.sheetnames
-            if sheet.startswith("Week ")
-        ]
-        week_sheets.sort(key=lambda ws: int(ws.title.split()[1]))
 
-        weeks_data = [parse_week_sheet(sheet, style_inspector) for sheet in week_sheets]
+def _json_default(value: Any) -> Any:
+    if is_dataclass(value) and not isinstance(value, type):
+        return {field.name: getattr(value, field.name) for field in fields(value)}
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
 
-        standings_sheet = (
-            workbook["Standings"] if "Standings" in workbook.sheetnames else None
+def _dumps(value: Any, pretty: bool) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        encoded = json.dumps(value, indent=2, ensure_ascii=False, default=_json_default)
+    else:
+        encoded = json.dumps(
+            value, separators=(",", ":"), ensure_ascii=False, default=_json_default
         )
-        standings = parse_standings(standings_sheet) if standings_sheet else {}
+    return encoded.encode("utf-8")
+
+
+def _encode_json(value: Any, pretty: bool, depth: int) -> bytes:
+    if not pretty:
+        return _dumps(value, False)
+    # JSON strings never contain raw newlines, so re-indenting a nested
+    # document is a plain byte replacement.
+    return _dumps(value, True).replace(b"\n", _newline(True, depth))
+
+
+def write_dataset(
+    outputs: Sequence[Tuple[Path, bool]],
+    generated_at: datetime,
+    weeks: Iterable[Dict[str, Any]],
+    standings: Dict[str, Dict[str, Any]],
+) -> int:
+    # Each output is (path, pretty). Standings are written after the weeks
+    # iterator is exhausted, so the caller may keep filling them in while
+    # weeks are parsed. Everything goes to a sibling .tmp file that replaces
+    # the real path only once the document is complete, so a failed run
+    # leaves the previous export untouched.
+    temp_paths = [path.with_name(path.name + ".tmp") for path, _ in outputs]
+    week_count = 0
+    try:
+        with ExitStack() as stack:
+            targets = [
+                (stack.enter_context(temp_path.open("wb")), pretty)
+                for temp_path, (_, pretty) in zip(temp_paths, outputs)
+            ]
+            for handle, pretty in targets:
+                colon = b": " if pretty else b":"
+                handle.write(
+                    b"{" + _newline(pretty, 1) + b'"generatedAt"' + colon + _dumps(generated_at, False)
+                    + b"," + _newline(pretty, 1) + b'"weeks"' + colon + b"["
+                )
+            for week in weeks:
+                for handle, pretty in targets:
+                    separator = b"," if week_count else b""
+                    handle.write(separator + _newline(pretty, 2) + _encode_json(week, pretty, 2))
+                week_count += 1
+            for handle, pretty in targets:
+                colon = b": " if pretty else b":"
+                handle.write(
+                    (_newline(pretty, 1) if week_count else b"") + b"],"
+                    + _newline(pretty, 1) + b'"standings"' + colon + _encode_json(standings, pretty, 1)
+                    + _newline(pretty, 0) + b"}"
+                )
+    except BaseException:
+        for temp_path in temp_paths:
+            temp_path.unlink(missing_ok=True)
+        raise
+    for temp_path, (path, _) in zip(temp_paths, outputs):
+        os.replace(temp_path, path)
+    return week_count
+
+
+def open_sheet_reader(
+    workbook: Union[Path, BinaryIO], use_calamine: bool = False
+) -> Tuple[List[str], Callable[[str], Any]]:
+    # Returns the workbook's sheet names and a loader for a sheet by name.
+    if use_calamine:
+        if isinstance(workbook, Path):
+            calamine_workbook = CalamineWorkbook.from_path(workbook)
+        else:
+            calamine_workbook = CalamineWorkbook.from_filelike(workbook)
+        return calamine_workbook.sheet_names, lambda name: CalamineWorksheet(calamine_workbook, name)
+    openpyxl_workbook = openpyxl.load_workbook(workbook, data_only=True, read_only=True)
+    return openpyxl_workbook.sheetnames, lambda name: openpyxl_workbook[name]
 
-        for week in weeks_data:
-            week_name = week.get("name")
-            if not isinstance(week_name, str):
-                continue
-            for player in week.get("players", []):
-                score = player.get("total_points")
-                if not isinstance(score, (int, float)):
-                    continue
-                player_name = player.get("name")
-                if not isinstance(player_name, str):
-                    continue
-                player_standings = standings.setdefault(player_name, {})
-                player_standings[week_name] = score
 
-        dataset = {
-            "generatedAt": datetime.now(UTC).isoformat(),
-            "weeks": weeks_data,
-            "standings": standings,
-        }
+_week_worker: Dict[str, Any] = {}
+
+
+def _init_week_worker(workbook_path: Path, use_calamine: bool) -> None:
+    # Worksheets cannot be pickled, so each worker process opens its own
+    # sheet reader once and keeps it until it exits.
+    _week_worker["workbook_path"] = workbook_path
+    _, _week_worker["get_sheet"] = open_sheet_reader(workbook_path, use_calamine)
+
+
+def _parse_week_in_worker(sheet_name: str) -> Dict[str, Any]:
+    # Each sheet's styles are only read once anyway, so the archive is opened
+    # per sheet rather than held open for the worker's lifetime.
+    with WorkbookStyleInspector(_week_worker["workbook_path"]) as style_inspector:
+        sheet = _week_worker["get_sheet"](sheet_name)
+        return parse_week_sheet(sheet, style_inspector)
+
+
+def _worker_count(value: str) -> int:
+    count = int(value)
+    if count < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {count}")
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export the grid workbook to JSON for the docs site.")
+    parser.add_argument(
+        "--workers",
+        type=_worker_count,
+        default=1,
+        help="parse week sheets in this many worker processes "
+        "(default: 1, in-process; 0 uses one per CPU)",
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help=f"also write an indented copy to {PRETTY_OUTPUT_PATH.name} for debugging",
+    )
+    parser.add_argument(
+        "--calamine",
+        action="store_true",
+        help="read sheets with python-calamine (faster, but error cells such as #N/A read as blank)",
+    )
+    args = parser.parse_args()
+    if args.calamine and CalamineWorkbook is None:
+        parser.error("--calamine needs the python-calamine package")
+    workers = args.workers or os.cpu_count() or 1
+
+    # Read the workbook from disk once; the sheet reader and, when weeks are
+    # parsed in-process, the style inspector each get their own BytesIO view
+    # over the same bytes. Pool workers open their own readers.
+    workbook_bytes = GRID_PATH.read_bytes()
+    sheet_names, get_sheet = open_sheet_reader(io.BytesIO(workbook_bytes), args.calamine)
+    numbered_weeks = [
+        (int(name.split()[1]), name)
+        for name in sheet_names
+        if name.startswith("Week ")
+    ]
+    numbered_weeks.sort(key=lambda item: item[0])
+    week_names = [name for _, name in numbered_weeks]
+
+    get_standings_sheet = get_sheet
+    if args.calamine:
+        # Standings is the formula-heavy sheet; calamine would blank its error
+        # results (#DIV/0!), so it is always read with openpyxl.
+        _, get_standings_sheet = open_sheet_reader(io.BytesIO(workbook_bytes))
+    standings_sheet = get_standings_sheet("Standings") if "Standings" in sheet_names else None
+    standings = parse_standings(standings_sheet) if standings_sheet else {}
+
+    def iter_weeks() -> Iterator[Dict[str, Any]]:
+        if workers > 1:
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(week_names)) or 1,
+                initializer=_init_week_worker,
+                initargs=(GRID_PATH, args.calamine),
+            ) as executor:
+                # map() yields in submission order, so weeks stay sorted.
+                for week in executor.map(_parse_week_in_worker, week_names):
+                    record_week_scores(week, standings)
+                    yield week
+            return
 
-        OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-        OUTPUT_PATH.write_text(json.dumps(dataset, indent=2), encoding="utf-8")
-        print(f"Wrote data for {len(weeks_data)} weeks to {OUTPUT_PATH}")
+        with (
+            zipfile.ZipFile(io.BytesIO(workbook_bytes)) as archive,
+            WorkbookStyleInspector(archive) as style_inspector,
+        ):
+            for name in week_names:
+                week = parse_week_sheet(get_sheet(name), style_inspector)
+                record_week_scores(week, standings)
+                yield week
+
+    outputs = [(OUTPUT_PATH, False)]
+    if args.pretty:
+        outputs.append((PRETTY_OUTPUT_PATH, True))
+
+    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    week_count = write_dataset(
+        outputs, datetime.now(UTC), iter_weeks(), standings
+    )
+    for path, _ in outputs:
+        print(f"Wrote data for {week_count} weeks to {path}")
 
 
 if __name__ == "__main__":